@@ -0,0 +1,177 @@
+"""
+Shared WCAG contrast helpers and report runner for the contrast check scripts.
+"""
+
+def hex_to_rgb(hex_color):
+    """
+    Converts a hex color string to an RGB tuple.
+
+    Args:
+        hex_color (str): The hex color string (e.g., '#ffffff' or 'ffffff').
+
+    Returns:
+        tuple: A tuple of (r, g, b) integers.
+    """
+    value = int(hex_color.lstrip('#'), 16)
+    return ((value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff)
+
+# Linearized sRGB value for every 8-bit channel level (WCAG 2.0 formula).
+_SRGB_LIN = tuple(
+    ((c + 0.055) / 1.055) ** 2.4 if c > 0.03928 else c / 12.92
+    for c in (i / 255.0 for i in range(256))
+)
+
+def luminance(rgb):
+    """
+    Calculates the relative luminance of an RGB color.
+
+    Formula from WCAG 2.0, using the precomputed `_SRGB_LIN` table.
+
+    Args:
+        rgb (tuple): A tuple of (r, g, b) values, where each is 0-255.
+
+    Returns:
+        float: The relative luminance value (0 to 1).
+    """
+    r, g, b = rgb
+    return 0.2126 * _SRGB_LIN[r] + 0.7152 * _SRGB_LIN[g] + 0.0722 * _SRGB_LIN[b]
+
+def _ratio_from_luminance(lum1, lum2):
+    """
+    Calculates the WCAG contrast ratio between two relative luminances.
+
+    Args:
+        lum1 (float): The first relative luminance (0 to 1).
+        lum2 (float): The second relative luminance (0 to 1).
+
+    Returns:
+        float: The contrast ratio (1 to 21).
+    """
+    brightest = max(lum1, lum2)
+    darkest = min(lum1, lum2)
+    return (brightest + 0.05) / (darkest + 0.05)
+
+def contrast_ratio(rgb1, rgb2):
+    """
+    Calculates the contrast ratio between two RGB colors.
+
+    Args:
+        rgb1 (tuple): The first RGB color tuple.
+        rgb2 (tuple): The second RGB color tuple.
+
+    Returns:
+        float: The contrast ratio (1 to 21).
+    """
+    return _ratio_from_luminance(luminance(rgb1), luminance(rgb2))
+
+def blend_color(fg_rgb, bg_rgb, alpha):
+    """
+    Blends a foreground color onto a background color with a given alpha.
+
+    The alpha is quantized to 8-bit fixed point so each channel is blended
+    with integer arithmetic only.
+
+    Args:
+        fg_rgb (tuple): The foreground RGB tuple.
+        bg_rgb (tuple): The background RGB tuple.
+        alpha (float): The alpha opacity of the foreground (0 to 1).
+
+    Returns:
+        tuple: The blended RGB color tuple.
+    """
+    a = int(alpha * 256 + 0.5)
+    inv = 256 - a
+    return (
+        (fg_rgb[0] * a + bg_rgb[0] * inv) >> 8,
+        (fg_rgb[1] * a + bg_rgb[1] * inv) >> 8,
+        (fg_rgb[2] * a + bg_rgb[2] * inv) >> 8,
+    )
+
+# Tailwind Colors (Slate, Teal, Rose, Indigo)
+colors = {
+    'white': '#ffffff',
+    'black': '#000000',
+    'slate-50': '#f8fafc',
+    'slate-100': '#f1f5f9',
+    'slate-200': '#e2e8f0',
+    'slate-300': '#cbd5e1',
+    'slate-400': '#94a3b8',
+    'slate-600': '#475569',
+    'slate-700': '#334155',
+    'slate-800': '#1e293b',
+    'slate-900': '#0f172a',
+    'teal-100': '#ccfbf1',
+    'teal-400': '#2dd4bf',
+    'teal-600': '#0d9488',
+    'teal-700': '#0f766e',
+    'teal-900': '#134e4a',
+    'rose-100': '#ffe4e6',
+    'rose-400': '#fb7185',
+    'rose-600': '#e11d48',
+    'rose-700': '#be123c',
+    'rose-900': '#881337',
+    'indigo-100': '#e0e7ff',
+    'indigo-400': '#818cf8',
+    'indigo-600': '#4f46e5',
+    'indigo-700': '#4338ca',
+    'indigo-900': '#312e81',
+}
+
+# Parsed RGB and luminance for every named color, built once at import
+rgb_table = {name: hex_to_rgb(hex_color) for name, hex_color in colors.items()}
+lum_table = {name: luminance(rgb) for name, rgb in rgb_table.items()}
+
+# WCAG (AA, AAA) minimum contrast ratios per text size
+# Normal Text: AA >= 4.5, AAA >= 7
+# Large Text (18pt or 14pt bold): AA >= 3, AAA >= 4.5
+# Icons/UI: AA >= 3
+WCAG_THRESHOLDS = {
+    'normal': (4.5, 7.0),
+    'large': (3.0, 4.5),
+}
+
+# Level names indexed by the number of thresholds met (AAA implies AA)
+WCAG_LEVELS = ("Fail", "AA", "AAA")
+
+def resolve_luminance(color):
+    """
+    Resolves the luminance of a scenario color.
+
+    Args:
+        color (str | tuple): A color name from `colors`, or an
+            (overlay, opacity, base) tuple describing a blended color.
+
+    Returns:
+        float: The relative luminance value (0 to 1).
+    """
+    if isinstance(color, tuple):
+        overlay_color, opacity, base_color_name = color
+        return luminance(blend_color(rgb_table[overlay_color], rgb_table[base_color_name], opacity))
+    return lum_table[color]
+
+def run(scenarios):
+    """
+    Prints a WCAG contrast report for the given scenarios.
+
+    Args:
+        scenarios (list): A list of scenario dicts with 'mode', 'text', 'bg',
+            'fg' and 'size' keys. 'bg' may be a color name or an
+            (overlay, opacity, base) blend tuple.
+
+    Returns:
+        None: The report is printed to stdout.
+    """
+    print(f"{'Mode':<6} | {'Element':<20} | {'Contrast':<8} | {'Pass?':<6} | {'Level':<5} | {'Details'}")
+    print("-" * 80)
+
+    # Resolve every scenario's luminances and ratios column-wise up front
+    lum_bgs = [resolve_luminance(s['bg']) for s in scenarios]
+    lum_fgs = [lum_table[s['fg']] for s in scenarios]
+    ratios = [_ratio_from_luminance(lum_fg, lum_bg) for lum_fg, lum_bg in zip(lum_fgs, lum_bgs)]
+
+    for s, ratio in zip(scenarios, ratios):
+        min_ratio, aaa_ratio = WCAG_THRESHOLDS[s['size']]
+        passed = ratio >= min_ratio
+        level = WCAG_LEVELS[passed + (ratio >= aaa_ratio)]
+
+        print(f"{s['mode']:<6} | {s['text']:<20} | {ratio:.2f}:1   | {'YES' if passed else 'NO':<6} | {level:<5} | {s['bg']} vs {s['fg']}")
@@ -1,13 +1,80 @@
 import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
 
+try:
+    import pyvips
+except (ImportError, OSError):
+    # OSError: the pyvips package is installed but libvips itself is missing
+    pyvips = None
+
+def _resize_with_vips(filepath, size):
+    """
+    Resizes an image with libvips and atomically replaces the original.
+
+    Args:
+        filepath (str): The path to the image file to be resized.
+        size (tuple): A tuple (width, height) representing the target size.
+
+    Returns:
+        tuple: The (width, height) of the resized image.
+    """
+    tmp_path = f"{filepath}.tmp.png"
+    try:
+        thumb = pyvips.Image.thumbnail(filepath, size[0], height=size[1], size="force")
+        thumb.pngsave(tmp_path, compression=9)
+        os.replace(tmp_path, filepath)
+    except Exception:
+        # Don't leave a partial temp file next to the asset
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return (thumb.width, thumb.height)
+
+def _resize_with_pil(img, filepath, size):
+    """
+    Resizes an open image with Pillow's LANCZOS filter and saves it in place.
+
+    Args:
+        img (PIL.Image.Image): The already opened source image.
+        filepath (str): The path to save the resized image to.
+        size (tuple): A tuple (width, height) representing the target size.
+
+    Returns:
+        tuple: The (width, height) of the resized image.
+    """
+    img_resized = img.resize(size, Image.Resampling.LANCZOS)
+    img_resized.save(filepath, "PNG", optimize=True)
+    return img_resized.size
+
+def _recompress_png(filepath):
+    """
+    Losslessly recompresses a PNG with oxipng, if it is installed.
+
+    Args:
+        filepath (str): The path to the PNG file.
+
+    Returns:
+        None: The file is rewritten in place when oxipng is available and
+              succeeds; otherwise it is left as is.
+    """
+    if shutil.which("oxipng") is None:
+        return
+    try:
+        subprocess.run(["oxipng", "-o", "4", "--strip", "safe", "-q", filepath], check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Warning: oxipng failed on {filepath} (exit code {e.returncode}); keeping resized file")
+
 def optimize_image(filepath, size=(192, 192)):
     """
     Resizes an image to the specified size and saves it.
 
-    This function opens an image from the given filepath, resizes it using
-    LANCZOS resampling for high quality, and saves it back to the same path
-    as a PNG file with optimization enabled.
+    This function resizes the image at the given filepath and saves it back
+    to the same path as a PNG file. libvips is used when `pyvips` is
+    installed, falling back to Pillow's LANCZOS resampling otherwise. If
+    `oxipng` is on the PATH, the result is then losslessly recompressed.
 
     Args:
         filepath (str): The path to the image file to be optimized.
@@ -26,21 +93,63 @@ def optimize_image(filepath, size=(192, 192)):
             print(f"Original size of {filepath}: {os.path.getsize(filepath) / 1024:.2f} KB")
             print(f"Original dimensions: {img.size}")
 
-            # Resize using LANCZOS for high quality downsampling
-            img_resized = img.resize(size, Image.Resampling.LANCZOS)
+            # Reuse the open image so Pillow decodes the pixels only once
+            if pyvips is None:
+                new_size = _resize_with_pil(img, filepath, size)
+
+        # libvips reads the file itself; Pillow above only parsed the header
+        if pyvips is not None:
+            new_size = _resize_with_vips(filepath, size)
 
-            # Save properly
-            img_resized.save(filepath, "PNG", optimize=True)
+        _recompress_png(filepath)
 
-            print(f"New size of {filepath}: {os.path.getsize(filepath) / 1024:.2f} KB")
-            print(f"New dimensions: {img_resized.size}")
+        print(f"New size of {filepath}: {os.path.getsize(filepath) / 1024:.2f} KB")
+        print(f"New dimensions: {new_size}")
 
     except Exception as e:
         print(f"Error processing {filepath}: {e}")
 
+def optimize_one(task):
+    """
+    Optimizes a single asset described by a (filepath, size) task.
+
+    Args:
+        task (tuple): A (filepath, size) tuple as accepted by `optimize_image`.
+
+    Returns:
+        None
+    """
+    filepath, size = task
+    optimize_image(filepath, size=size)
+
+def optimize_all(tasks):
+    """
+    Optimizes several assets, spreading them across CPU cores.
+
+    Each file is decoded, resized and encoded independently, so tasks run in
+    a process pool. A single task is run inline to skip the pool startup.
+
+    Args:
+        tasks (list): A list of (filepath, size) tuples.
+
+    Returns:
+        None
+    """
+    if len(tasks) <= 1:
+        for task in tasks:
+            optimize_one(task)
+        return
+
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(optimize_one, tasks))
+
+# Assets to optimize, as (filepath, target size) pairs
+ASSETS = [
+    ("public/favicon.png", (192, 192)),
+]
+
 if __name__ == "__main__":
-    # Optimize favicon.png
-    optimize_image("public/favicon.png", size=(192, 192))
+    optimize_all(ASSETS)
 
     # Check star_style.png (just logging, not resizing unless we decide to)
     if os.path.exists("star_style.png"):